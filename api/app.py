@@ -1,5 +1,8 @@
 from flask import Flask, request, jsonify
 import os
+import json
+import hashlib
+import threading
 from trello_integration import trello_api
 from email_integration import email_api
 from calendar_integration import calendar_api
@@ -7,6 +10,41 @@ from chatbot import assistant
 
 app = Flask(__name__)
 
+# Seconds clients may reuse a read response before revalidating it
+READ_CACHE_MAX_AGE = int(os.getenv("READ_CACHE_MAX_AGE", "30"))
+
+# Serialized read responses keyed by route: {"version", "etag", "body"}
+_read_cache = {}
+
+# Guards _read_cache so concurrent polls never cache a mismatched version/body
+_read_cache_lock = threading.Lock()
+
+def cached_json_response(key, version, build):
+    """Return a JSON response with a content-hash ETag and Cache-Control
+
+    build() is only called when version differs from the cached one, and a
+    matching If-None-Match gets a 304 without a body.
+    """
+    with _read_cache_lock:
+        entry = _read_cache.get(key)
+        
+        if entry is None or entry["version"] != version:
+            body = json.dumps(build())
+            entry = {
+                "version": version,
+                "etag": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+                "body": body
+            }
+            _read_cache[key] = entry
+    
+    response = app.response_class(entry["body"], mimetype="application/json")
+    response.set_etag(entry["etag"])
+    response.cache_control.private = True
+    response.cache_control.max_age = READ_CACHE_MAX_AGE
+    
+    # Turns the response into a 304 if the client's ETag still matches
+    return response.make_conditional(request)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint"""
@@ -44,12 +82,12 @@ def create_task():
 def get_due_tasks():
     """Get tasks that are due soon"""
     try:
-        # Get tasks from Trello
-        tasks = trello_api.get_due_tasks()
+        # Only recompute when the due tasks have changed
+        version, board = trello_api.get_due_tasks_version()
         
-        return jsonify({
+        return cached_json_response("tasks_due", version, lambda: {
             "success": True,
-            "tasks": tasks
+            "tasks": trello_api.get_due_tasks(board)
         })
     except Exception as e:
         return jsonify({
@@ -119,6 +157,23 @@ def schedule_meeting():
             "message": f"Failed to schedule meeting: {str(e)}"
         }), 500
 
+@app.route('/api/meetings/upcoming', methods=['GET'])
+def get_upcoming_meetings():
+    """Get upcoming meetings from Google Calendar"""
+    try:
+        # Only recompute when the upcoming meetings have changed
+        version, events_data = calendar_api.get_meetings_version()
+        
+        return cached_json_response("meetings_upcoming", version, lambda: {
+            "success": True,
+            "meetings": calendar_api.get_upcoming_meetings(events_data=events_data)
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Failed to get upcoming meetings: {str(e)}"
+        }), 500
+
 @app.route('/api/settings/update', methods=['POST'])
 def update_settings():
     """Update application settings"""
@@ -3,6 +3,7 @@ import requests
 import json
 from datetime import datetime, timedelta
 import pytz
+from http_cache.conditional_requests import conditional_get
 
 # Get Google Calendar API key from environment variables
 GCALENDAR_KEY = os.getenv("GCALENDAR_KEY")
@@ -75,18 +76,23 @@ def schedule_meeting(title, date_time, attendees=None, description=""):
     
     return response.json()
 
-def get_upcoming_meetings(days=7):
-    """Get upcoming meetings from Google Calendar"""
+def get_upcoming_events(days=7):
+    """Get raw upcoming events from Google Calendar, with a version for them
+
+    The query window is widened to whole hours so repeated requests send the
+    same query and can be revalidated with If-None-Match. Use
+    filter_upcoming_events() to narrow the result back to the exact window.
+    """
     if not GCALENDAR_KEY:
         raise Exception("Google Calendar API key not configured")
     
     # Google Calendar API endpoint
     url = f"https://www.googleapis.com/calendar/v3/calendars/{GCALENDAR_CALENDAR_ID}/events"
     
-    # Calculate time range
-    now = datetime.now(pytz.timezone(DEFAULT_TIMEZONE))
-    time_min = now.isoformat()
-    time_max = (now + timedelta(days=days)).isoformat()
+    # Calculate time range covering [now, now + days] in whole hours
+    hour_start = datetime.now(pytz.timezone(DEFAULT_TIMEZONE)).replace(minute=0, second=0, microsecond=0)
+    time_min = hour_start.isoformat()
+    time_max = (hour_start + timedelta(days=days, hours=1)).isoformat()
     
     # Prepare query parameters
     params = {
@@ -98,20 +104,53 @@ def get_upcoming_meetings(days=7):
     }
     
     # Make the API request
-    response = requests.get(url, params=params)
+    response, events_data, version = conditional_get(url, params=params)
     
-    if response.status_code != 200:
+    if events_data is None:
         raise Exception(f"Failed to get upcoming meetings: {response.text}")
     
-    # Process the response
-    events_data = response.json()
-    meetings = []
+    return version, events_data
+
+def filter_upcoming_events(events_data, days=7):
+    """Keep timed events that have not ended and start within the next days
+
+    Mirrors Google's timeMin (end time) and timeMax (start time) filtering.
+    """
+    now = datetime.now(pytz.timezone(DEFAULT_TIMEZONE))
+    window_end = now + timedelta(days=days)
     
+    events = []
     for event in events_data.get("items", []):
-        # Skip events without a start time (all-day events)
-        if "dateTime" not in event.get("start", {}):
+        # Skip all-day events, which have dates rather than times
+        if "dateTime" not in event.get("start", {}) or "dateTime" not in event.get("end", {}):
             continue
         
+        start_time = datetime.fromisoformat(event["start"]["dateTime"].replace("Z", "+00:00"))
+        end_time = datetime.fromisoformat(event["end"]["dateTime"].replace("Z", "+00:00"))
+        if end_time > now and start_time < window_end:
+            events.append(event)
+    
+    return events
+
+def get_meetings_version(days=7):
+    """Return (version, events_data) where version changes whenever get_upcoming_meetings() would
+
+    The IDs of the events currently in the window are part of the version, so
+    events starting or ending change it even if the calendar did not.
+    """
+    events_version, events_data = get_upcoming_events(days)
+    event_ids = tuple(event["id"] for event in filter_upcoming_events(events_data, days))
+    return (events_version, event_ids), events_data
+
+def get_upcoming_meetings(days=7, events_data=None):
+    """Get upcoming meetings from Google Calendar"""
+    # Fetch the events unless already fetched
+    if events_data is None:
+        _, events_data = get_upcoming_events(days)
+    
+    meetings = []
+    
+    for event in filter_upcoming_events(events_data, days):
         # Parse the start time
         start_time = datetime.fromisoformat(event["start"]["dateTime"].replace("Z", "+00:00"))
         
@@ -0,0 +1,60 @@
+import threading
+import itertools
+import requests
+
+# Cached GET responses keyed by URL, revalidated with If-None-Match
+_response_cache = {}
+
+# Guards the cache so concurrent requests never see a mismatched version/data pair
+_cache_lock = threading.Lock()
+
+# Every change to any cached response gets a fresh version number
+_versions = itertools.count(1)
+
+def conditional_get(url, params=None):
+    """GET a resource, revalidating any cached copy with its ETag
+
+    Returns (response, data, version). On a 304 the cached data is reused and
+    only headers are transferred. version changes whenever the data changes,
+    and data is None if the request failed.
+    """
+    params = params or {}
+    
+    with _cache_lock:
+        cached = _response_cache.get(url)
+    
+    # A cached copy only applies to the same query; a new one replaces it
+    if cached and cached["params"] != params:
+        cached = None
+    
+    headers = {}
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    
+    response = requests.get(url, params=params, headers=headers)
+    
+    if response.status_code == 304 and cached:
+        return response, cached["data"], cached["version"]
+    
+    if response.status_code != 200:
+        return response, None, None
+    
+    data = response.json()
+    
+    with _cache_lock:
+        current = _response_cache.get(url)
+        
+        # Keep the version when the data is unchanged (e.g. no ETag was sent)
+        if current and current["params"] == params and current["data"] == data:
+            version = current["version"]
+        else:
+            version = next(_versions)
+        
+        _response_cache[url] = {
+            "params": params,
+            "etag": response.headers.get("ETag"),
+            "data": data,
+            "version": version
+        }
+    
+    return response, data, version
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The API modules import each other as top-level packages from api/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,217 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import app as app_module
+from calendar_integration import calendar_api
+from http_cache import conditional_requests
+from trello_integration import trello_api
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, etag=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = {"ETag": etag} if etag else {}
+        self.text = ""
+
+    def json(self):
+        return self._data
+
+
+class FakeUpstream:
+    """Serves JSON by URL suffix and honours If-None-Match like Trello/Google"""
+
+    def __init__(self):
+        self.resources = {}
+        self.calls = []
+
+    def set(self, suffix, data, etag=None):
+        self.resources[suffix] = (data, etag)
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append((url, headers or {}))
+        for suffix, (data, etag) in self.resources.items():
+            if url.endswith(suffix):
+                if etag and (headers or {}).get("If-None-Match") == etag:
+                    return FakeResponse(304)
+                return FakeResponse(200, data, etag)
+        return FakeResponse(404)
+
+    def calls_to(self, suffix):
+        return [headers for url, headers in self.calls if url.endswith(suffix)]
+
+
+def iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def make_card(card_id, due, name="Task"):
+    return {
+        "id": card_id,
+        "name": name,
+        "desc": "",
+        "due": iso(due),
+        "idList": "todo",
+        "idMembers": ["m1"]
+    }
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    fake = FakeUpstream()
+    monkeypatch.setattr(conditional_requests.requests, "get", fake.get)
+    monkeypatch.setattr(conditional_requests, "_response_cache", {})
+    monkeypatch.setattr(app_module, "_read_cache", {})
+    monkeypatch.setattr(trello_api, "TRELLO_KEY", "key")
+    monkeypatch.setattr(trello_api, "TRELLO_TOKEN", "token")
+    monkeypatch.setattr(trello_api, "TRELLO_BOARD_ID", "board")
+    monkeypatch.setattr(trello_api, "TRELLO_TODO_LIST_ID", "todo")
+    monkeypatch.setattr(trello_api, "TRELLO_DONE_LIST_ID", "done")
+    monkeypatch.setattr(calendar_api, "GCALENDAR_KEY", "key")
+    monkeypatch.setattr(calendar_api, "DEFAULT_TIMEZONE", "UTC")
+
+    now = datetime.now(timezone.utc)
+    fake.set("/boards/board/cards", [make_card("c1", now + timedelta(days=2))], '"cards-1"')
+    fake.set("/boards/board/members", [
+        {"id": "m1", "fullName": "Alice Smith", "initials": "AS", "username": "alice"}
+    ], '"members-1"')
+    return fake
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def build_count(monkeypatch):
+    counts = {"tasks": 0}
+    get_due_tasks = trello_api.get_due_tasks
+
+    def counting_get_due_tasks(*args, **kwargs):
+        counts["tasks"] += 1
+        return get_due_tasks(*args, **kwargs)
+
+    monkeypatch.setattr(trello_api, "get_due_tasks", counting_get_due_tasks)
+    return counts
+
+
+def test_due_tasks_sets_etag_and_cache_control(upstream, client):
+    response = client.get("/api/tasks/due")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+    assert "private" in response.headers["Cache-Control"]
+    assert f"max-age={app_module.READ_CACHE_MAX_AGE}" in response.headers["Cache-Control"]
+    assert response.get_json()["tasks"][0]["owner"]["name"] == "Alice Smith"
+
+
+def test_matching_if_none_match_returns_304(upstream, client):
+    etag = client.get("/api/tasks/due").headers["ETag"]
+
+    response = client.get("/api/tasks/due", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_unchanged_version_skips_build_and_reuses_upstream_cache(upstream, client, build_count):
+    first = client.get("/api/tasks/due")
+    second = client.get("/api/tasks/due")
+
+    assert build_count["tasks"] == 1
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert second.get_json() == first.get_json()
+
+    # One board fetch per poll, revalidated with the upstream ETag
+    card_calls = upstream.calls_to("/boards/board/cards")
+    assert len(card_calls) == 2
+    assert card_calls[1]["If-None-Match"] == '"cards-1"'
+
+
+def test_changed_board_produces_new_etag(upstream, client, build_count):
+    first = client.get("/api/tasks/due").headers["ETag"]
+
+    now = datetime.now(timezone.utc)
+    upstream.set("/boards/board/cards", [
+        make_card("c1", now + timedelta(days=2), name="Renamed task")
+    ], '"cards-2"')
+    response = client.get("/api/tasks/due", headers={"If-None-Match": first})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first
+    assert response.get_json()["tasks"][0]["title"] == "Renamed task"
+    assert build_count["tasks"] == 2
+
+
+def test_changed_board_without_etag_is_detected(upstream, client):
+    now = datetime.now(timezone.utc)
+    upstream.set("/boards/board/cards", [make_card("c1", now + timedelta(days=2))])
+    first = client.get("/api/tasks/due").headers["ETag"]
+
+    upstream.set("/boards/board/cards", [
+        make_card("c1", now + timedelta(days=2), name="Renamed task")
+    ])
+
+    assert client.get("/api/tasks/due").headers["ETag"] != first
+
+
+def test_member_rename_produces_new_etag(upstream, client):
+    first = client.get("/api/tasks/due").headers["ETag"]
+
+    upstream.set("/boards/board/members", [
+        {"id": "m1", "fullName": "Alice Jones", "initials": "AJ", "username": "alice"}
+    ], '"members-2"')
+    response = client.get("/api/tasks/due")
+
+    assert response.headers["ETag"] != first
+    assert response.get_json()["tasks"][0]["owner"]["name"] == "Alice Jones"
+
+
+def test_card_leaving_due_window_produces_new_etag(upstream, client, monkeypatch):
+    now = datetime.now(timezone.utc)
+    upstream.set("/boards/board/cards", [
+        make_card("c1", now + timedelta(days=2)),
+        make_card("c2", now + timedelta(minutes=1))
+    ], '"cards-2"')
+    first = client.get("/api/tasks/due")
+    assert len(first.get_json()["tasks"]) == 2
+
+    # The board is unchanged upstream, but c2's due time has now passed
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now + timedelta(minutes=2)
+
+    monkeypatch.setattr(trello_api, "datetime", LaterDatetime)
+    second = client.get("/api/tasks/due")
+
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert [task["id"] for task in second.get_json()["tasks"]] == ["c1"]
+
+
+def test_upcoming_meetings_excludes_ended_events(upstream, client):
+    now = datetime.now(timezone.utc)
+    upstream.set("/events", {"items": [
+        {
+            "id": "ended",
+            "summary": "Standup",
+            "start": {"dateTime": iso(now - timedelta(minutes=30))},
+            "end": {"dateTime": iso(now - timedelta(minutes=15))}
+        },
+        {
+            "id": "upcoming",
+            "summary": "Review",
+            "start": {"dateTime": iso(now + timedelta(hours=2))},
+            "end": {"dateTime": iso(now + timedelta(hours=3))}
+        }
+    ]}, '"events-1"')
+
+    response = client.get("/api/meetings/upcoming")
+    etag = response.headers["ETag"]
+
+    assert [meeting["id"] for meeting in response.get_json()["meetings"]] == ["upcoming"]
+    assert client.get("/api/meetings/upcoming", headers={"If-None-Match": etag}).status_code == 304
+    assert len(upstream.calls_to("/events")) == 2
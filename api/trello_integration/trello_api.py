@@ -1,6 +1,7 @@
 import os
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from http_cache.conditional_requests import conditional_get
 
 # Trello API base URL
 TRELLO_API_URL = "https://api.trello.com/1"
@@ -13,6 +14,9 @@ TRELLO_TODO_LIST_ID = os.getenv("TRELLO_TODO_LIST_ID")
 TRELLO_INPROGRESS_LIST_ID = os.getenv("TRELLO_INPROGRESS_LIST_ID")
 TRELLO_DONE_LIST_ID = os.getenv("TRELLO_DONE_LIST_ID")
 
+# How far ahead a task counts as due soon
+DUE_SOON_WINDOW = timedelta(days=7)
+
 def get_auth_params():
     """Return the authentication parameters for Trello API requests"""
     return {
@@ -69,36 +73,84 @@ def get_cards(list_id=None):
     else:
         url = f"{TRELLO_API_URL}/boards/{TRELLO_BOARD_ID}/cards"
     
-    response = requests.get(url, params=get_auth_params())
+    response, cards, _ = conditional_get(url, params=get_auth_params())
     
-    if response.status_code != 200:
+    if cards is None:
         raise Exception(f"Failed to get Trello cards: {response.text}")
     
-    return response.json()
+    return cards
 
-def get_due_tasks():
-    """Get tasks that are due soon (within the next 7 days)"""
-    # Get all cards from the board
-    all_cards = get_cards()
+def get_board():
+    """Get the board's cards and members, with a version covering both
+
+    Both are revalidated upstream, so an unchanged board costs only headers.
+    """
+    if not TRELLO_KEY or not TRELLO_TOKEN:
+        raise Exception("Trello API credentials not configured")
     
-    # Filter cards with due dates in the next 7 days
-    due_soon = []
-    today = datetime.now()
-    seven_days_later = today + timedelta(days=7)
+    url = f"{TRELLO_API_URL}/boards/{TRELLO_BOARD_ID}/cards"
+    response, cards, cards_version = conditional_get(url, params=get_auth_params())
+    
+    if cards is None:
+        raise Exception(f"Failed to get Trello cards: {response.text}")
+    
+    url = f"{TRELLO_API_URL}/boards/{TRELLO_BOARD_ID}/members"
+    params = {"fields": "fullName,initials,username", **get_auth_params()}
+    response, members, members_version = conditional_get(url, params=params)
+    
+    if members is None:
+        raise Exception(f"Failed to get Trello board members: {response.text}")
+    
+    return (cards_version, members_version), {"cards": cards, "members": members}
+
+def get_due_soon_cards(cards):
+    """Filter cards that are due within the due-soon window and not done"""
+    today = datetime.now(timezone.utc)
+    window_end = today + DUE_SOON_WINDOW
     
-    for card in all_cards:
-        if card.get("due"):
+    due_soon = []
+    for card in cards:
+        if card.get("due") and card["idList"] != TRELLO_DONE_LIST_ID:
             due_date = datetime.fromisoformat(card["due"].replace("Z", "+00:00"))
-            if today <= due_date <= seven_days_later and card["idList"] != TRELLO_DONE_LIST_ID:
-                # Format the card data for the frontend
-                due_soon.append({
-                    "id": card["id"],
-                    "title": card["name"],
-                    "description": card["desc"],
-                    "dueDate": card["due"],
-                    "owner": get_member_details(card.get("idMembers", [])[0]) if card.get("idMembers") else None,
-                    "status": get_status_from_list_id(card["idList"])
-                })
+            if today <= due_date <= window_end:
+                due_soon.append(card)
+    
+    return due_soon
+
+def get_due_tasks_version():
+    """Return (version, board) where version changes whenever get_due_tasks(board) would
+
+    The IDs of the cards currently due soon are part of the version, so cards
+    entering or leaving the window change it even if the board did not.
+    """
+    board_version, board = get_board()
+    due_ids = tuple(card["id"] for card in get_due_soon_cards(board["cards"]))
+    return (board_version, due_ids), board
+
+def get_due_tasks(board=None):
+    """Get tasks that are due soon (within the next 7 days)"""
+    # Get all cards and members from the board unless already fetched
+    if board is None:
+        _, board = get_board()
+    
+    members = {member["id"]: member for member in board["members"]}
+    
+    due_soon = []
+    for card in get_due_soon_cards(board["cards"]):
+        owner = None
+        if card.get("idMembers"):
+            member = members.get(card["idMembers"][0])
+            owner = format_member(member) if member else {"name": "Unknown", "initials": "??"}
+        
+        # Format the card data for the frontend
+        due_soon.append({
+            "id": card["id"],
+            "title": card["name"],
+            "description": card["desc"],
+            "dueDate": card["due"],
+            "owner": owner,
+            "status": get_status_from_list_id(card["idList"])
+        })
     
     return due_soon
 
@@ -119,12 +171,15 @@ def get_member_details(member_id):
         return None
     
     url = f"{TRELLO_API_URL}/members/{member_id}"
-    response = requests.get(url, params=get_auth_params())
+    response, member, _ = conditional_get(url, params=get_auth_params())
     
-    if response.status_code != 200:
+    if member is None:
         return {"name": "Unknown", "initials": "??"}
     
-    member = response.json()
+    return format_member(member)
+
+def format_member(member):
+    """Format Trello member data for the frontend"""
     return {
         "id": member["id"],
         "name": member["fullName"],